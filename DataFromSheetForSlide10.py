@@ -1,7 +1,65 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
+from excel_reader import read_edge_columns, edge_columns
+from excel_blocks import label_finder
 import os
+import sys
 
-def print_data_from_sheet_pandas(excel_file_path, sheet_name):
+def format_table(table_title, col0, tail, find_label):
+    """
+    Finds one titled table in the sheet's first column and returns it laid out as
+    text (or the reason it could not be read), ready to be written to the console.
+    """
+    try:
+        # Find the start and end rows for the current table block
+        start_index = find_label(table_title)
+        if start_index == -1:
+            return f"\n--- Could not find table title: '{table_title}' ---\n"
+
+        # The first 'Grand Total' at or below the title closes the table
+        end_index = find_label('Grand Total', start_index)
+        if end_index == -1:
+            return f"\n--- Could not find 'Grand Total' for table: '{table_title}' ---\n"
+
+        # --- Collect Data for Formatting ---
+        # Find the actual header row within the table block by searching for 'Week'
+        # in the last 4 cells of each row, from the title row down to the grand total row
+        week_mask = (np.char.find(tail[start_index:end_index].astype(str), 'Week') >= 0).any(axis=1)
+        if not week_mask.any():
+            return f"\n--- Could not find a header row (e.g., 'Week 27') for table: '{table_title}' ---\n"
+        header_row_index = start_index + int(week_mask.argmax())
+
+        week_labels = [str(0 if pd.isna(label) else label).strip() for label in tail[header_row_index]]
+        
+        # Prepare data for printing
+        header_for_print = ['Category'] + week_labels
+
+        # The actual data rows start on the line AFTER the header and go to the end of the block;
+        # rows without a title are dropped with one mask
+        data_rows = slice(header_row_index + 1, end_index + 1)
+        keep = col0[data_rows] != ''
+        titles = col0[data_rows][keep]
+        # Convert data to integers in one pass; empty cells become 0 here rather than via a sheet-wide fillna
+        block = tail[data_rows][keep]
+        block = np.where(pd.isna(block), 0, block).astype(np.float64).astype(np.int64)
+        data_for_print = [[row_title] + data for row_title, data in zip(titles, block.tolist())]
+        
+        # --- Format the Table ---
+        # Let pandas lay out and align the columns, keeping the category names left-aligned
+        out_df = pd.DataFrame(data_for_print, columns=header_for_print)
+        category_width = max(out_df['Category'].str.len().max(), len('Category'))
+        out_df['Category'] = out_df['Category'].str.ljust(category_width)
+        out_df = out_df.rename(columns={'Category': 'Category'.ljust(category_width)})
+        header_line, body = out_df.to_string(index=False).split("\n", 1)
+        lines = [f"\n--- Verifying Data for: {table_title} ---", header_line, '-' * len(header_line), body]
+        return "\n".join(lines) + "\n"
+
+    except Exception as find_error:
+        return f"\n--- An error occurred while processing table '{table_title}': {find_error} ---\n"
+
+def print_data_from_sheet_pandas(excel_file_path, sheet_name, df=None):
     """
     This function reads an Excel sheet with multiple tables, finds specific tables
     by their title, and for each table, prints all its rows and the data from 
@@ -10,12 +68,23 @@ def print_data_from_sheet_pandas(excel_file_path, sheet_name):
     Args:
         excel_file_path (str): The full path to the Excel file.
         sheet_name (str): The name of the sheet to read from.
+        df (pd.DataFrame, optional): The sheet, already loaded with header=None.
+            When given, the workbook is not read again.
     """
     try:
         # --- Initial Setup ---
-        # Read the Excel file and immediately fill any empty cells (NaN) with 0.
-        df = pd.read_excel(excel_file_path, sheet_name=sheet_name, header=None).fillna(0)
-        df[0] = df[0].astype(str).str.strip()
+        # Only the title column and the last four (week) columns are used, so read just
+        # those (from the DataFrame when one is given) as two arrays, one entry per row.
+        # Empty cells are filled with 0 only where they are printed.
+        if df is None:
+            col0_raw, tail = read_edge_columns(excel_file_path, sheet_name)
+        else:
+            col0_raw, tail = edge_columns(df)
+        col0 = pd.Series(col0_raw).fillna(0).astype(str).str.strip().to_numpy()
+
+        # Index the first-column labels once, so finding a table title or its
+        # 'Grand Total' is a lookup instead of a column scan.
+        find_label = label_finder(col0)
         
         file_name = os.path.basename(excel_file_path)
         print(f"--- Reading data from sheet '{sheet_name}' in {file_name} ---")
@@ -27,74 +96,11 @@ def print_data_from_sheet_pandas(excel_file_path, sheet_name):
         ]
 
         # --- Process Each Table ---
-        for table_title in target_tables:
-            try:
-                # Find the start and end rows for the current table block
-                title_rows = df[df[0] == table_title]
-                if title_rows.empty:
-                    print(f"\n--- Could not find table title: '{table_title}' ---")
-                    continue
-                start_index = title_rows.index[0]
-
-                search_area = df.iloc[start_index:]
-                grand_total_rows = search_area[search_area[0] == 'Grand Total']
-                if grand_total_rows.empty:
-                    print(f"\n--- Could not find 'Grand Total' for table: '{table_title}' ---")
-                    continue
-                end_index = grand_total_rows.index[0]
-
-                # --- Collect Data for Formatting ---
-                # Find the actual header row within the table block by searching for 'Week'
-                header_row_index = -1
-                # We search from the title row down to the grand total row
-                for idx in range(start_index, end_index):
-                    row_data = df.iloc[idx]
-                    # Check if any of the last 4 cells in the row contain the string 'Week'
-                    if any('Week' in str(cell) for cell in row_data.iloc[-4:]):
-                        header_row_index = idx
-                        break
-                
-                if header_row_index == -1:
-                    print(f"\n--- Could not find a header row (e.g., 'Week 27') for table: '{table_title}' ---")
-                    continue
-
-                header_row = df.iloc[header_row_index]
-                week_labels = [str(label).strip() for label in header_row.iloc[-4:]]
-                
-                # Prepare data for printing
-                header_for_print = ['Category'] + week_labels
-                data_for_print = []
-
-                # The actual data rows start on the line AFTER the header and go to the end of the block
-                for i in range(header_row_index + 1, end_index + 1):
-                    current_row = df.iloc[i]
-                    row_title = str(current_row.iloc[0]).strip()
-                    if not row_title:
-                        continue
-                    
-                    # Convert data to integers to remove decimals from the '0.0' that fillna might create
-                    data = [int(val) for val in current_row.iloc[-4:]]
-                    data_for_print.append([row_title] + data)
-                
-                # --- Format and Print the Table ---
-                print(f"\n--- Verifying Data for: {table_title} ---")
-                
-                # Calculate column widths for alignment
-                all_rows = [header_for_print] + data_for_print
-                col_widths = [max(len(str(item)) for item in col) for col in zip(*all_rows)]
-
-                # Print Header
-                header_line = "  ".join(header_for_print[i].ljust(col_widths[i]) for i in range(len(header_for_print)))
-                print(header_line)
-                print('-' * len(header_line))
-
-                # Print Data Rows
-                for row in data_for_print:
-                    data_line = "  ".join(str(row[i]).ljust(col_widths[i]) for i in range(len(row)))
-                    print(data_line)
-
-            except Exception as find_error:
-                print(f"\n--- An error occurred while processing table '{table_title}': {find_error} ---")
+        # The tables only read the shared arrays, so they are laid out concurrently
+        # and then written in their original order
+        with ThreadPoolExecutor(max_workers=len(target_tables)) as executor:
+            table_texts = list(executor.map(lambda title: format_table(title, col0, tail, find_label), target_tables))
+        sys.stdout.write("".join(table_texts))
 
         print(f"\n--- Data extraction for sheet '{sheet_name}' complete ---")
 
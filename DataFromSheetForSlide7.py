@@ -1,72 +1,53 @@
 import pandas as pd
+from excel_reader import read_sheet
+from excel_blocks import cached_per_frame, extract_block, find_data_row, last_n_week_cols, stack_columns
 import os
+import sys
 
 # =================================================================================
 # HELPER FUNCTIONS FOR DATA EXTRACTION
 # =================================================================================
 
+# Lower-cased string copy of the whole sheet, cached per DataFrame so that
+# repeated title searches on the same sheet only convert it once.
+_cells_lower_cache = {}
+
 def find_header_row(df: pd.DataFrame, title_text: str) -> int:
     """
     Finds the row index of a table's header by searching for a title
     that appears in the row below the header.
     """
-    for index, row in df.iterrows():
-        # Search the entire row for the title text
-        for cell_value in row:
-            if title_text.lower() in str(cell_value).lower():
-                # The header row is assumed to be one row above the title
-                return index - 1
-    return -1
-
-def find_data_row(df: pd.DataFrame, label_text: str) -> int:
-    """Finds the row index for a specific data label in the first column."""
-    for index, row in df.iterrows():
-        if label_text.lower() in str(row.iloc[0]).lower():
-            return index
-    return -1
+    cells = cached_per_frame(_cells_lower_cache, df, lambda d: d.astype(str).apply(lambda col: col.str.lower()))
+    # Search the entire row for the title text
+    title = title_text.lower()
+    mask = cells.apply(lambda col: col.str.contains(title, na=False, regex=False)).any(axis=1)
+    # The header row is assumed to be one row above the title
+    return mask.idxmax() - 1 if mask.any() else -1
 
 def extract_data_block(df: pd.DataFrame, start_label: str, num_rows: int):
     """
     Extracts a block of data starting from a specific label in the first column.
     This is used for tables like 'INC Created by' and 'INC Resolved by'.
     """
-    start_row_idx = find_data_row(df, start_label)
-    if start_row_idx == -1:
+    # The header is assumed to be the row directly above the starting data label,
+    # and only its last four "Week" columns are kept
+    headers, categories, block = extract_block(df, start_label, num_rows, header_offset=-1)
+    if headers is None:
         print(f"\nWarning: Could not find data block starting with '{start_label}'")
         return None, None
 
-    # The header is assumed to be the row directly above the starting data label
-    header_row_idx = start_row_idx - 1
-    header_row = df.iloc[header_row_idx]
-    
-    # FIX: Find all column identifiers whose header contains "Week"
-    all_week_cols = [col for col, h in header_row.items() if "Week" in str(h)]
-    # FIX: Get the last four of these column identifiers
-    last_four_week_cols = all_week_cols[-4:]
-    # FIX: Get the corresponding header text for those columns
-    last_four_week_headers = [str(header_row[col]) for col in last_four_week_cols]
-
-    data_end_row = start_row_idx + num_rows
-    
-    categories = df.iloc[start_row_idx : data_end_row, 0].values.tolist()
-    
-    data_dict = {
-        header: df.loc[start_row_idx : data_end_row - 1, col].tolist()
-        for header, col in zip(last_four_week_headers, last_four_week_cols)
-    }
+    last_four_week_headers = [str(h) for h in headers]
+    data_dict = dict(zip(last_four_week_headers, block.T.tolist()))
         
-    return categories, data_dict
-
+    return categories.tolist(), data_dict
 
 def extract_stats_chart_data(df: pd.DataFrame):
     """Extracts data for the 'Incidents weekly Stats' chart by finding row labels."""
     # The week headers are in the first row of the DataFrame
     inc_header_row = df.iloc[0]
 
-    # FIX: Find all column identifiers whose header contains "Week"
-    all_week_cols = [col for col, h in inc_header_row.items() if "Week" in str(h)]
-    # FIX: Get the last four of these column identifiers
-    last_four_week_cols = all_week_cols[-4:]
+    # FIX: Get the column identifiers of the last four headers containing "Week"
+    last_four_week_cols = last_n_week_cols(inc_header_row)
     # FIX: Get the corresponding header text for those columns
     last_four_week_headers = [str(inc_header_row[col]) for col in last_four_week_cols]
 
@@ -94,29 +75,24 @@ def print_chart_data(title: str, categories, data_dict):
     if data_dict is None or categories is None:
         return
     
-    print(f"\n--- Verifying Data for: {title} ---")
-    
     series_labels = list(data_dict.keys())
     
     header = f"{'Category':<25}" + "".join([f"{label:<15}" for label in series_labels])
-    print(header)
-    print("-" * len(header))
+    lines = [f"\n--- Verifying Data for: {title} ---", header, "-" * len(header)]
     
-    for i, category in enumerate(categories):
-        row_str = f"{category:<25}"
-        for week in series_labels:
-            # Ensure index is within bounds
-            if i < len(data_dict[week]):
-                row_str += f"{str(data_dict[week][i]):<15}"
-        print(row_str)
+    values = stack_columns([data_dict[week] for week in series_labels], len(categories))
+    for category, row in zip(categories, values):
+        lines.append(f"{category:<25}" + "".join([f"{str(value):<15}" for value in row]))
+    sys.stdout.write("\n".join(lines) + "\n")
 
 # =================================================================================
 # SCRIPT EXECUTION
 # =================================================================================
 
-def main():
+def main(df: pd.DataFrame = None):
     """
     This script reads an Excel file and prints specific data tables to the terminal.
+    An already-loaded DataFrame can be passed in to skip reading the workbook.
     """
     # --- SCRIPT CONFIGURATION ---
     EXCEL_FILE_PATH = 'C:/Users/Mahesh/VScode/ExcelToPpt/Files/ExcelData27.xlsx'
@@ -124,18 +100,18 @@ def main():
 
     print(f"--- Reading data from {os.path.basename(EXCEL_FILE_PATH)} ---")
 
-    try:
-        # Using default engine for .xlsx files
-        df = pd.read_excel(EXCEL_FILE_PATH, sheet_name=SHEET_NAME)
-    except ImportError:
-        print("🛑 ERROR: The 'openpyxl' library is required for .xlsx files. Please run: pip install openpyxl")
-        return
-    except FileNotFoundError:
-        print(f"🛑 ERROR: The file was not found at the specified path:\n{EXCEL_FILE_PATH}")
-        return
-    except Exception as e:
-        print(f"🛑 ERROR: Failed to read Excel file. {e}")
-        return
+    if df is None:
+        try:
+            df = read_sheet(EXCEL_FILE_PATH, SHEET_NAME)
+        except ImportError:
+            print("🛑 ERROR: No Excel engine is available. Please run: pip install python-calamine")
+            return
+        except FileNotFoundError:
+            print(f"🛑 ERROR: The file was not found at the specified path:\n{EXCEL_FILE_PATH}")
+            return
+        except Exception as e:
+            print(f"🛑 ERROR: Failed to read Excel file. {e}")
+            return
 
     # --- Extract and print data for all three charts ---
     # The first data block starts with "Tools Created" and has 4 rows
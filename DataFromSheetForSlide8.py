@@ -1,5 +1,7 @@
 import pandas as pd
+from excel_reader import read_sheet
 import os
+import sys
 from typing import List, Dict, Tuple
 
 # =================================================================================
@@ -46,26 +48,25 @@ def print_chart_data(title: str, categories: List[str], data_dict: Dict[str, Lis
     if data_dict is None or categories is None:
         return
     
-    print(f"\n--- Verifying Data for: {title} ---")
-    
     # Header row: 'Category' followed by the week numbers
     header = f"{'Category':<25}" + "".join([f"{cat:<15}" for cat in categories])
-    print(header)
-    print("-" * len(header))
+    lines = [f"\n--- Verifying Data for: {title} ---", header, "-" * len(header)]
     
     # Data rows: Each series name followed by its data for each week
     for series_name, series_data in data_dict.items():
         row_str = f"{series_name:<25}"
         row_str += "".join([f"{str(value):<15}" for value in series_data])
-        print(row_str)
+        lines.append(row_str)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 # =================================================================================
 # SCRIPT EXECUTION
 # =================================================================================
 
-def main():
+def main(df: pd.DataFrame = None):
     """
     This script reads the 'Pending Counts' sheet and prints the data for Slide 8.
+    An already-loaded DataFrame can be passed in to skip reading the workbook.
     """
     # --- SCRIPT CONFIGURATION ---
     EXCEL_FILE_PATH = 'C:/Users/Mahesh/VScode/ExcelToPpt/Files/ExcelData27.xlsx'
@@ -73,23 +74,24 @@ def main():
 
     print(f"--- Reading data from sheet '{SHEET_NAME}' in {os.path.basename(EXCEL_FILE_PATH)} ---")
 
-    try:
-        # Using default engine for .xlsx files
-        df = pd.read_excel(EXCEL_FILE_PATH, sheet_name=SHEET_NAME)
-        # Clean up column names by stripping leading/trailing whitespace
-        df.columns = df.columns.str.strip()
-    except ImportError:
-        print("🛑 ERROR: The 'openpyxl' library is required for .xlsx files. Please run: pip install openpyxl")
-        return
-    except FileNotFoundError:
-        print(f"🛑 ERROR: The file was not found at the specified path:\n{EXCEL_FILE_PATH}")
-        return
-    except ValueError as e:
-         print(f"🛑 ERROR: Sheet '{SHEET_NAME}' not found in the Excel file. {e}")
-         return
-    except Exception as e:
-        print(f"🛑 ERROR: Failed to read Excel file. {e}")
-        return
+    if df is None:
+        try:
+            df = read_sheet(EXCEL_FILE_PATH, SHEET_NAME)
+        except ImportError:
+            print("🛑 ERROR: No Excel engine is available. Please run: pip install python-calamine")
+            return
+        except FileNotFoundError:
+            print(f"🛑 ERROR: The file was not found at the specified path:\n{EXCEL_FILE_PATH}")
+            return
+        except ValueError as e:
+             print(f"🛑 ERROR: Sheet '{SHEET_NAME}' not found in the Excel file. {e}")
+             return
+        except Exception as e:
+            print(f"🛑 ERROR: Failed to read Excel file. {e}")
+            return
+
+    # Clean up column names by stripping leading/trailing whitespace
+    df.columns = df.columns.str.strip()
 
     # --- Define the series labels (column headers) for each chart ---
     inc_series_labels = ["Pending INCs", "INCs Resolved", "Total INCs Created"]
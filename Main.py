@@ -1,38 +1,135 @@
+import numpy as np
 import pandas as pd
 from pptx import Presentation
 from pptx.util import Pt, Inches, Cm
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.chart.data import CategoryChartData, ChartData
-from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION, XL_LABEL_POSITION, XL_TICK_MARK
+from pptx.enum.chart import XL_CHART_TYPE, XL_LABEL_POSITION, XL_TICK_MARK
 from pptx.dml.color import RGBColor
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from xml.sax.saxutils import escape
+from lxml.etree import SubElement
 import re
 from dataclasses import dataclass
 from typing import List, Dict, Any, Tuple
 import os
-import win32com.client
-import time
+import sys
+import logging
 import math
+from concurrent.futures import ThreadPoolExecutor
 import copy
+from excel_blocks import cached_per_frame, extract_block, find_data_row, last_n_week_cols
+from excel_reader import read_sheets
+from workbook_cache import HAS_CALAMINE
+
+try:
+    # PowerPoint's own chart styles (such as 228) can only be applied through COM, on Windows
+    import win32com.client
+    HAS_WIN32COM = True
+except ImportError:
+    HAS_WIN32COM = False
 
 # =================================================================================
 # SHARED HELPER FUNCTIONS
 # =================================================================================
 
-def find_shape_by_name(slide, name):
-    """Finds a shape on a slide by its name."""
+# Progress messages go through logging; set LOGLEVEL=WARNING to keep only warnings and errors
+log = logging.getLogger(__name__)
+
+class _ProgressFormatter(logging.Formatter):
+    """Prints progress (INFO) messages as they are and prefixes warnings and errors with their level."""
+    def formatMessage(self, record):
+        message = super().formatMessage(record)
+        return message if record.levelno <= logging.INFO else f"{record.levelname}: {message}"
+
+_WEEK_RE = re.compile(r'Week\s*(\d+)')
+_PAST_WEEKS_RE = re.compile(r"(past)(\s+)(weeks)", re.IGNORECASE)
+_WEEKNUM_RE = re.compile(r'\d+')
+_INC_CONC_RE = re.compile(r'(Total Incidents raised for the week\s+)\d+(\s+is\s+)\d+(\.)')
+_RITM_CONC_RE = re.compile(r'(Total RITM raised for the Week\s+)\d+(\s+is\s+)\d+(,\s*Fulfilled\s*–\s*)\d+')
+
+_SHAPE_NOT_FOUND_MSG = "Shape with name '%s' not found on the slide."
+
+_A_P, _A_PPR, _A_R, _A_RPR, _A_LATIN, _A_T = (qn(tag) for tag in ("a:p", "a:pPr", "a:r", "a:rPr", "a:latin", "a:t"))
+
+def build_shape_index(slide):
+    """Maps each shape name on a slide to its shape in a single pass over slide.shapes."""
+    shape_index = {}
     for shape in slide.shapes:
-        if shape.name == name:
-            return shape
-    print(f"Warning: Shape with name '{name}' not found on the slide.")
-    return None
+        # Keep the first shape for a repeated name, as the linear search did
+        shape_index.setdefault(shape.name, shape)
+    return shape_index
+
+def _shape_index(slide):
+    """Returns the slide's name -> shape index, built on first use and kept on the slide object."""
+    if not hasattr(slide, '_name_idx'):
+        slide._name_idx = build_shape_index(slide)
+    return slide._name_idx
+
+def _invalidate_shape_index(slide):
+    """Drops a slide's cached shape index; call after removing shapes from the slide."""
+    if hasattr(slide, '_name_idx'):
+        del slide._name_idx
+
+def find_shape_by_name(slide, name):
+    """Finds a shape on a slide by its name, through the slide's cached shape index."""
+    shape = _shape_index(slide).get(name)
+    if shape is None:
+        log.warning(_SHAPE_NOT_FOUND_MSG, name)
+    return shape
+
+def add_series_from_array(chart_data, series_names, series_values: np.ndarray) -> np.ndarray:
+    """
+    Adds one series per row of a (series, categories) array in a single pass and
+    returns the same values as float64, ready for scaling the value axis.
+    """
+    for name, values in zip(series_names, series_values):
+        # tolist() hands python-pptx the values with the types they were read as
+        chart_data.add_series(name, values.tolist())
+    return series_values.astype(np.float64)
+
+def _set_run_xml(run, name: str, size: int, bold=None):
+    """Sets a run's typeface, point size and (unless bold is None) weight straight on its <a:rPr>."""
+    rPr = run._r.get_or_add_rPr()
+    rPr.get_or_add_latin().set('typeface', name)
+    rPr.set('sz', str(size * 100))
+    if bold is not None:
+        rPr.set('b', '1' if bold else '0')
+
+def _write_cell_text(tc, text: str, algn: str = None, typeface: str = None, size: int = None, bold=None):
+    """
+    Replaces a table cell's text like `cell.text = text`, building its <a:p>/<a:r>/<a:t>
+    elements directly. algn sets each paragraph's alignment; typeface, size and bold
+    (each left out when None) are written to every run's <a:rPr>.
+    """
+    txBody = tc.get_or_add_txBody()
+    for p in txBody.findall(_A_P):
+        txBody.remove(p)
+    rPr_attrib = {}
+    if size is not None:
+        rPr_attrib['sz'] = str(size * 100)
+    if bold is not None:
+        rPr_attrib['b'] = '1' if bold else '0'
+    for line in text.split("\n"):
+        p = SubElement(txBody, _A_P)
+        if algn is not None:
+            SubElement(p, _A_PPR, algn=algn)
+        if not line: continue
+        r = SubElement(p, _A_R)
+        if rPr_attrib or typeface is not None:
+            rPr = SubElement(r, _A_RPR, rPr_attrib)
+            if typeface is not None:
+                SubElement(rPr, _A_LATIN, typeface=typeface)
+        SubElement(r, _A_T).text = line
 
 def format_main_title(shape, last_week):
     """Sets the text and formatting for the main title of the slide."""
     if not (shape and shape.has_text_frame): return
-    match = re.search(r'Week\s*(\d+)', str(last_week))
+    match = _WEEK_RE.search(str(last_week))
     week_num = match.group(1) if match else ""
     if not week_num:
-        print("Warning: Could not extract week number from title.")
+        log.warning("Could not extract week number from title.")
         return
     
     original_text = shape.text_frame.text
@@ -40,7 +137,7 @@ def format_main_title(shape, last_week):
     if '$' in original_text:
         new_text = original_text.replace('$', week_num)
     else:
-        new_text = re.sub(r"(past)(\s+)(weeks)", rf"\1 {week_num} \3", original_text, flags=re.IGNORECASE)
+        new_text = _PAST_WEEKS_RE.sub(rf"\1 {week_num} \3", original_text)
 
     p = shape.text_frame.paragraphs[0]
     p.text = new_text
@@ -49,6 +146,43 @@ def format_main_title(shape, last_week):
     p.font.size = Pt(22)
     p.font.bold = True
 
+# Formatting shared by every chart: parsed once, then copied into each chart's XML
+_TXPR_9PT = parse_xml(f'<c:txPr {nsdecls("c", "a")}><a:bodyPr/><a:lstStyle/><a:p><a:pPr><a:defRPr sz="900"/></a:pPr></a:p></c:txPr>')
+_LEGEND_BOTTOM = parse_xml(
+    f'<c:legend {nsdecls("c", "a")}><c:legendPos val="b"/><c:layout/><c:overlay val="0"/>'
+    '<c:txPr><a:bodyPr/><a:lstStyle/><a:p><a:pPr><a:defRPr sz="900"/></a:pPr></a:p></c:txPr></c:legend>'
+)
+_TITLE_XML = (
+    '<c:title {nsdecls}><c:tx><c:rich><a:bodyPr/><a:lstStyle/><a:p><a:pPr><a:defRPr sz="{size}"{bold}/></a:pPr>'
+    '<a:r><a:t>{text}</a:t></a:r></a:p></c:rich></c:tx><c:layout/><c:overlay val="0"/></c:title>'
+)
+
+def _set_txPr(element, txPr):
+    """Replaces the text properties of a chart element (axis, data labels) with a copy of txPr."""
+    element._remove_txPr()
+    element._insert_txPr(copy.deepcopy(txPr))
+
+def _format_chart(chart, title: str, title_size: int = 22, title_bold: bool = False):
+    """
+    Applies the title, bottom legend, 9pt data labels and axis tick labels, and the '0'
+    value format used by all charts, writing the XML directly rather than property by property.
+    """
+    c_chart = chart._chartSpace.chart
+    c_chart._remove_title()
+    c_chart._insert_title(parse_xml(_TITLE_XML.format(
+        nsdecls=nsdecls("c", "a"), size=title_size * 100, bold=' b="1"' if title_bold else '', text=escape(title))))
+    c_chart._remove_legend()
+    c_chart._insert_legend(copy.deepcopy(_LEGEND_BOTTOM))
+
+    value_axis = chart.value_axis
+    value_axis.tick_labels.number_format = '0'
+    _set_txPr(value_axis._element, _TXPR_9PT)
+    _set_txPr(chart.category_axis._element, _TXPR_9PT)
+
+    plot = chart.plots[0]
+    plot.has_data_labels = True
+    _set_txPr(plot._element.dLbls, _TXPR_9PT)
+
 # =================================================================================
 # LOGIC FOR SLIDE 6
 # =================================================================================
@@ -59,61 +193,56 @@ class TableData:
     headers: List[str]
     row_labels: List[str]
     data: Dict[str, List[Any]]
+    # The same values as a (rows, weeks) array, in the order of row_labels and headers
+    values: np.ndarray = None
 
 def _extract_slide6_table_data(df: pd.DataFrame, title: str, header_row_idx: int, num_data_rows: int) -> TableData:
-    header_row = df.iloc[header_row_idx]
-    all_weeks = [header_row[col] for col in df.columns if "Week" in str(header_row[col])]
-    last_four_weeks = all_weeks[-4:]
-    week_cols = [col for col in df.columns if header_row[col] in last_four_weeks]
-    data_start_row = header_row_idx + 1
-    data_end_row = data_start_row + num_data_rows
-    data_rows_df = df.iloc[data_start_row:data_end_row].set_index(df.columns[0])
-    row_labels = data_rows_df.index.tolist()
-    data_dict = {header_row[col]: data_rows_df[col].tolist() for col in week_cols}
-    return TableData(title=title, headers=last_four_weeks, row_labels=row_labels, data=data_dict)
-
-def _set_font_for_table_slide6(table):
-    for row_idx, row in enumerate(table.rows):
-        is_total_row = 'total' in str(row.cells[0].text).lower()
-        for cell in row.cells:
-            for para in cell.text_frame.paragraphs:
-                para.alignment = PP_ALIGN.CENTER
-                for run in para.runs:
-                    run.font.name = "Aptos"
-                    run.font.size = Pt(11)
-                    if row_idx == 0 or is_total_row:
-                        run.font.bold = True
-                    else:
-                        run.font.bold = False
+    last_four_weeks, row_labels, block = extract_block(df, header_row_idx, num_data_rows)
+    data_dict = dict(zip(last_four_weeks, block.T.tolist()))
+    return TableData(title=title, headers=last_four_weeks, row_labels=row_labels.tolist(), data=data_dict, values=block)
+
+def _set_font_for_cell_slide6(cell, bold: bool):
+    for para in cell.text_frame.paragraphs:
+        para.alignment = PP_ALIGN.CENTER
+        for run in para.runs:
+            _set_run_xml(run, "Aptos", 11, bold)
 
 def _populate_table_slide6(table_shape, table_data: TableData):
     if not (table_shape and table_shape.has_table): return
     table = table_shape.table
-    for i, header in enumerate(table_data.headers):
-        table.cell(0, i + 1).text = str(header)
+    cell_text = {(0, i + 1): str(header) for i, header in enumerate(table_data.headers)}
     for row_idx, label in enumerate(table_data.row_labels):
-        table.cell(row_idx + 1, 0).text = label
+        cell_text[(row_idx + 1, 0)] = label
         for col_idx, header in enumerate(table_data.headers):
-            table.cell(row_idx + 1, col_idx + 1).text = str(table_data.data[header][row_idx])
-    _set_font_for_table_slide6(table)
+            cell_text[(row_idx + 1, col_idx + 1)] = str(table_data.data[header][row_idx])
+
+    # Write and format each populated cell in one pass over the table XML; cells
+    # that keep their template text are only reformatted.
+    for row_idx, tr in enumerate(table._tbl.tr_lst):
+        label = cell_text.get((row_idx, 0), table.cell(row_idx, 0).text)
+        bold = row_idx == 0 or 'total' in str(label).lower()
+        for col_idx, tc in enumerate(tr.tc_lst):
+            text = cell_text.get((row_idx, col_idx))
+            if text is None:
+                _set_font_for_cell_slide6(table.cell(row_idx, col_idx), bold)
+            else:
+                _write_cell_text(tc, text, algn="ctr", typeface="Aptos", size=11, bold=bold)
 
 def _add_line_chart_slide6(slide, position, table_data: TableData, num_gridlines: int):
     chart_data = CategoryChartData()
     chart_data.categories = table_data.headers
     
-    all_values = []
-    for i, label in enumerate(table_data.row_labels):
-        if 'total' in label.lower(): continue
-        values = [table_data.data[h][i] for h in table_data.headers]
-        all_values.extend(values)
-        chart_data.add_series(label, values)
+    # Each series is a row of the extracted value array; total rows are left out of the chart
+    series_mask = np.array(['total' not in label.lower() for label in table_data.row_labels], dtype=bool)
+    series_names = [label for label, keep in zip(table_data.row_labels, series_mask) if keep]
+    chart_values = add_series_from_array(chart_data, series_names, table_data.values[series_mask])
         
     chart_shape = slide.shapes.add_chart(XL_CHART_TYPE.LINE_MARKERS, *position, chart_data)
     chart = chart_shape.chart
     
     value_axis = chart.value_axis
-    if num_gridlines and all_values:
-        max_val = max(all_values) if all_values else 0
+    if num_gridlines and chart_values.size:
+        max_val = chart_values.max().item()
         if max_val > 0:
             power = 10**math.floor(math.log10(max_val))
             max_y = math.ceil(max_val / power) * power
@@ -127,31 +256,17 @@ def _add_line_chart_slide6(slide, position, table_data: TableData, num_gridlines
         value_axis.major_unit = max_y / num_gridlines
         value_axis.has_major_gridlines = True
 
-    tick_labels = value_axis.tick_labels
-    tick_labels.number_format = '0'
-    tick_labels.font.size = Pt(9)
-    
-    chart.has_title = True
-    chart.chart_title.text_frame.text = f'{table_data.title} Resolved'
-    chart.chart_title.text_frame.paragraphs[0].font.size = Pt(22)
-    chart.has_legend = True
-    chart.legend.position = XL_LEGEND_POSITION.BOTTOM
-    chart.legend.include_in_layout = False
-    chart.legend.font.size = Pt(9)
-    plot = chart.plots[0]
-    plot.has_data_labels = True
-    plot.data_labels.font.size = Pt(9)
-    chart.category_axis.tick_labels.font.size = Pt(9)
+    _format_chart(chart, f'{table_data.title} Resolved')
 
 def populate_slide_6(prs, df, slide_index):
-    print(f"--- Populating Slide {slide_index + 1} ---")
+    log.info("--- Populating Slide %d ---", slide_index + 1)
     slide = prs.slides[slide_index]
     inc_data_obj = _extract_slide6_table_data(df, title="INC", header_row_idx=0, num_data_rows=5)
     ritm_data_obj = _extract_slide6_table_data(df, title="RITM", header_row_idx=8, num_data_rows=5)
-    print("   -> Formatting main title...")
+    log.info("   -> Formatting main title...")
     title_shape = find_shape_by_name(slide, 'MainTitle')
     if title_shape: format_main_title(title_shape, inc_data_obj.headers[-1])
-    print("   -> Populating tables...")
+    log.info("   -> Populating tables...")
     inc_table_shape = find_shape_by_name(slide, 'INC Table') 
     ritm_table_shape = find_shape_by_name(slide, 'RITM Table')
     _populate_table_slide6(inc_table_shape, inc_data_obj)
@@ -164,44 +279,36 @@ def populate_slide_6(prs, df, slide_index):
     inc_chart_position = (Cm(0.67), Cm(1.81), Cm(15.49), Cm(6.58))
     ritm_chart_position = (Cm(17.42), Cm(1.81), Cm(15.49), Cm(6.58))
     
-    print("   -> Creating line charts...")
+    log.info("   -> Creating line charts...")
     _add_line_chart_slide6(slide, inc_chart_position, inc_data_obj, num_gridlines=5)
     _add_line_chart_slide6(slide, ritm_chart_position, ritm_data_obj, num_gridlines=5)
-    print(f"✅ Slide {slide_index + 1} populated.")
+    log.info("✅ Slide %d populated.", slide_index + 1)
 
 # =================================================================================
 # LOGIC FOR SLIDE 7
 # =================================================================================
 
-def _find_data_row(df: pd.DataFrame, label_text: str) -> int:
-    for index, row in df.iterrows():
-        if label_text.lower() in str(row.iloc[0]).lower():
-            return index
-    return -1
-
 def _extract_data_block_slide7(df: pd.DataFrame, start_label: str, num_rows: int):
-    start_row_idx = _find_data_row(df, start_label)
+    start_row_idx = find_data_row(df, start_label)
     if start_row_idx == -1: return None, None
     header_row_idx = start_row_idx - 1
     header_row = df.iloc[header_row_idx]
-    all_week_cols = [col for col, h in header_row.items() if "Week" in str(h)]
-    last_four_week_cols = all_week_cols[-4:]
-    last_four_week_headers = [str(header_row[col]) for col in last_four_week_cols]
+    last_four_week_cols = last_n_week_cols(header_row)
+    last_four_week_headers = header_row[last_four_week_cols].astype(str).tolist()
     data_end_row = start_row_idx + num_rows
     categories = df.iloc[start_row_idx : data_end_row, 0].values.tolist()
-    data_dict = {h: df.loc[start_row_idx : data_end_row - 1, col].tolist() for h, col in zip(last_four_week_headers, last_four_week_cols)}
+    block = df.iloc[start_row_idx : data_end_row, df.columns.get_indexer(last_four_week_cols)].to_numpy(dtype=object)
+    data_dict = dict(zip(last_four_week_headers, block.T.tolist()))
     return categories, data_dict
 
 def _extract_stats_data_slide7(df: pd.DataFrame):
     inc_header_row = df.iloc[0]
-    all_week_cols = [col for col, h in inc_header_row.items() if "Week" in str(h)]
-    last_four_week_cols = all_week_cols[-4:]
-    last_four_week_headers = [str(inc_header_row[col]) for col in last_four_week_cols]
-    created_row_idx = _find_data_row(df, 'INCs created')
-    resolved_row_idx = _find_data_row(df, 'INCs resolved')
+    last_four_week_cols = last_n_week_cols(inc_header_row)
+    last_four_week_headers = inc_header_row[last_four_week_cols].astype(str).tolist()
+    created_row_idx = find_data_row(df, 'INCs created')
+    resolved_row_idx = find_data_row(df, 'INCs resolved')
     if created_row_idx == -1 or resolved_row_idx == -1: return None, None
-    created_data = df.loc[created_row_idx, last_four_week_cols].tolist()
-    resolved_data = df.loc[resolved_row_idx, last_four_week_cols].tolist()
+    created_data, resolved_data = df.iloc[[created_row_idx, resolved_row_idx], df.columns.get_indexer(last_four_week_cols)].to_numpy(dtype=object).tolist()
     categories = ['INCs created', 'INCs resolved']
     data_dict = {w: [c, r] for w, c, r in zip(last_four_week_headers, created_data, resolved_data)}
     return categories, data_dict
@@ -225,49 +332,46 @@ def _add_bar_chart_slide7(slide, categories, data_dict, position, title, y_axis_
     value_axis.has_major_gridlines = True
     value_axis.major_tick_mark = XL_TICK_MARK.NONE
     
-    tick_labels = value_axis.tick_labels
-    tick_labels.number_format = '0'
-    tick_labels.font.size = Pt(9)
-
-    chart.has_title = True
-    chart.chart_title.text_frame.text = title
-    chart.chart_title.text_frame.paragraphs[0].font.size = Pt(12)
-    chart.chart_title.text_frame.paragraphs[0].font.bold = True
-    chart.has_legend = True
-    chart.legend.position = XL_LEGEND_POSITION.BOTTOM
-    chart.legend.include_in_layout = False
-    chart.legend.font.size = Pt(9)
-    plot = chart.plots[0]
-    plot.has_data_labels = True
-    plot.data_labels.font.size = Pt(9)
-    chart.category_axis.tick_labels.font.size = Pt(9)
+    _format_chart(chart, title, title_size=12, title_bold=True)
 
 def populate_slide_7(prs, df, slide_index):
-    print(f"--- Populating Slide {slide_index + 1} ---")
+    log.info("--- Populating Slide %d ---", slide_index + 1)
     slide = prs.slides[slide_index]
-    print("   -> Extracting data for bar charts...")
+    log.info("   -> Extracting data for bar charts...")
     creation_cats, creation_data = _extract_data_block_slide7(df, start_label="Tools Created", num_rows=4)
     closed_cats, closed_data = _extract_data_block_slide7(df, start_label="Auto closed by Tools", num_rows=2)
     stats_cats, stats_data = _extract_stats_data_slide7(df)
     pos_created = (Cm(1.69), Cm(1.76), Cm(13.27), Cm(6.38))
     pos_resolved = (Cm(18.27), Cm(1.76), Cm(13.91), Cm(6.38))
     pos_stats = (Cm(1.69), Cm(9.75), Cm(13.27), Cm(6.77))
-    print("   -> Creating bar charts with fixed axis scale...")
+    log.info("   -> Creating bar charts with fixed axis scale...")
     _add_bar_chart_slide7(slide, creation_cats, creation_data, pos_created, "INC Created by", y_axis_max=1600.0, num_gridlines=7)
     _add_bar_chart_slide7(slide, closed_cats, closed_data, pos_resolved, "INC Resolved by", y_axis_max=1600.0, num_gridlines=7)
     _add_bar_chart_slide7(slide, stats_cats, stats_data, pos_stats, "INC Stats", y_axis_max=1600.0, num_gridlines=7)
-    print(f"✅ Slide {slide_index + 1} populated.")
+    log.info("✅ Slide %d populated.", slide_index + 1)
 
 # =================================================================================
 # LOGIC FOR SLIDE 8
 # =================================================================================
 
+# Frames whose column names have already been stripped, keyed by id(df)
+_stripped_columns_cache = {}
+
+def _strip_column_names(df: pd.DataFrame):
+    """Strips whitespace from the column names in place, only the first time a DataFrame is seen."""
+    def strip(d):
+        d.columns = d.columns.str.strip()
+        return True
+    cached_per_frame(_stripped_columns_cache, df, strip)
+
 def _extract_pending_data_slide8(df: pd.DataFrame, series_labels: List[str], week_column_label: str = 'Week #') -> Tuple[List[str], Dict[str, List]]:
-    valid_series_labels = [label for label in series_labels if label in df.columns]
+    columns = set(df.columns)
+    valid_series_labels = [label for label in series_labels if label in columns]
     if not valid_series_labels: return None, None
     last_four_rows_df = df.tail(4)
     categories = last_four_rows_df[week_column_label].astype(str).tolist()
-    data_dict = {label: last_four_rows_df[label].tolist() for label in valid_series_labels}
+    block = last_four_rows_df[valid_series_labels].to_numpy(dtype=object)
+    data_dict = dict(zip(valid_series_labels, block.T.tolist()))
     return categories, data_dict
 
 def _add_chart_slide8(slide, categories, data_dict, position, title, num_gridlines: int):
@@ -275,17 +379,15 @@ def _add_chart_slide8(slide, categories, data_dict, position, title, num_gridlin
     chart_data = ChartData()
     chart_data.categories = categories
     
-    all_values = []
-    for series_name, values in data_dict.items():
-        chart_data.add_series(series_name, values)
-        all_values.extend(values)
+    # Every series has one value per week, so they stack into a single series x weeks array
+    chart_values = add_series_from_array(chart_data, data_dict, np.array(list(data_dict.values()), dtype=object))
 
     chart_shape = slide.shapes.add_chart(XL_CHART_TYPE.LINE_MARKERS, *position, chart_data)
     chart = chart_shape.chart
     
     value_axis = chart.value_axis
-    if num_gridlines and all_values:
-        max_val = max(all_values) if all_values else 0
+    if num_gridlines and chart_values.size:
+        max_val = chart_values.max().item()
         if max_val > 0:
             power = 10**math.floor(math.log10(max_val))
             max_y = math.ceil(max_val / power) * power
@@ -299,62 +401,38 @@ def _add_chart_slide8(slide, categories, data_dict, position, title, num_gridlin
         value_axis.major_unit = max_y / num_gridlines
         value_axis.has_major_gridlines = True
 
-    tick_labels = value_axis.tick_labels
-    tick_labels.number_format = '0'
-    tick_labels.font.size = Pt(9)
-    
-    chart.has_title = True
-    chart.chart_title.text_frame.text = title
-    chart.chart_title.text_frame.paragraphs[0].font.size = Pt(22)
-    chart.has_legend = True
-    chart.legend.position = XL_LEGEND_POSITION.BOTTOM
-    chart.legend.include_in_layout = False
-    chart.legend.font.size = Pt(9)
-    plot = chart.plots[0]
-    plot.has_data_labels = True
-    plot.data_labels.font.size = Pt(9)
     chart.value_axis.major_tick_mark = XL_TICK_MARK.NONE
-    chart.category_axis.tick_labels.font.size = Pt(9)
+    _format_chart(chart, title)
 
 def _update_text_boxes_slide8(slide, inc_data, ritm_data, inc_cats, ritm_cats):
     if inc_data:
         inc_total_created = inc_data.get("Total INCs Created", [0])[-1]
-        last_week_num = re.search(r'\d+', inc_cats[-1]).group(0)
+        last_week_num = _WEEKNUM_RE.search(inc_cats[-1]).group(0)
         inc_conc_shape = find_shape_by_name(slide, "INC Conc")
         if inc_conc_shape and inc_conc_shape.has_text_frame:
             p1 = inc_conc_shape.text_frame.paragraphs[0]
-            p1.text = re.sub(
-                r'(Total Incidents raised for the week\s+)\d+(\s+is\s+)\d+(\.)',
-                rf'\g<1>{last_week_num}\g<2>{inc_total_created}\g<3>',
-                p1.text
-            )
+            p1.text = _INC_CONC_RE.sub(rf'\g<1>{last_week_num}\g<2>{inc_total_created}\g<3>', p1.text)
             for run in p1.runs:
-                run.font.name = 'Calibri'
-                run.font.size = Pt(11)
-            print("   -> Updated 'INC Conc' text box.")
+                _set_run_xml(run, 'Calibri', 11)
+            log.info("   -> Updated 'INC Conc' text box.")
 
     if ritm_data:
         ritm_total_created = ritm_data.get("Total RITMs Created", [0])[-1]
         ritm_fulfilled = ritm_data.get("RITMs Fulfilled", [0])[-1]
-        last_week_num = re.search(r'\d+', ritm_cats[-1]).group(0)
+        last_week_num = _WEEKNUM_RE.search(ritm_cats[-1]).group(0)
         ritm_conc_shape = find_shape_by_name(slide, "RITM Conc")
         if ritm_conc_shape and ritm_conc_shape.has_text_frame:
             p = ritm_conc_shape.text_frame.paragraphs[0]
-            p.text = re.sub(
-                r'(Total RITM raised for the Week\s+)\d+(\s+is\s+)\d+(,\s*Fulfilled\s*–\s*)\d+',
-                rf'\g<1>{last_week_num}\g<2>{ritm_total_created}\g<3>{ritm_fulfilled}',
-                p.text
-            )
+            p.text = _RITM_CONC_RE.sub(rf'\g<1>{last_week_num}\g<2>{ritm_total_created}\g<3>{ritm_fulfilled}', p.text)
             for run in p.runs:
-                run.font.name = 'Calibri'
-                run.font.size = Pt(11)
-            print("   -> Updated 'RITM Conc' text box.")
+                _set_run_xml(run, 'Calibri', 11)
+            log.info("   -> Updated 'RITM Conc' text box.")
 
 def populate_slide_8(prs, df, slide_index):
-    print(f"--- Populating Slide {slide_index + 1} ---")
+    log.info("--- Populating Slide %d ---", slide_index + 1)
     slide = prs.slides[slide_index]
-    df.columns = df.columns.str.strip()
-    print("   -> Extracting data for charts...")
+    _strip_column_names(df)
+    log.info("   -> Extracting data for charts...")
     inc_series_labels = ["Pending INCs", "INCs Resolved", "Total INCs Created"]
     ritm_series_labels = ["Pending RITMs", "RITMs Fulfilled", "Total RITMs Created"]
     inc_cats, inc_data = _extract_pending_data_slide8(df, inc_series_labels)
@@ -364,73 +442,68 @@ def populate_slide_8(prs, df, slide_index):
     pos_inc = (Cm(1.94), Cm(2.28), Cm(13.65), Cm(8.1))
     pos_ritm = (Cm(18.01), Cm(2.28), Cm(13.65), Cm(8.1))
 
-    print("   -> Creating line charts...")
+    log.info("   -> Creating line charts...")
     _add_chart_slide8(slide, inc_cats, inc_data, pos_inc, "INC Resolved", num_gridlines=8)
     _add_chart_slide8(slide, ritm_cats, ritm_data, pos_ritm, "RITMs Resolved", num_gridlines=8)
-    print("   -> Updating text boxes...")
+    log.info("   -> Updating text boxes...")
     _update_text_boxes_slide8(slide, inc_data, ritm_data, inc_cats, ritm_cats)
-    print(f"✅ Slide {slide_index + 1} populated.")
+    log.info("✅ Slide %d populated.", slide_index + 1)
 
 # =================================================================================
 # LOGIC FOR SLIDE 9
 # =================================================================================
 
 def _extract_data_block_slide9(df: pd.DataFrame, start_label: str, num_rows: int):
-    start_row_idx = _find_data_row(df, start_label)
+    start_row_idx = find_data_row(df, start_label)
     if start_row_idx == -1: return None, None, None
-    header_row = df.iloc[start_row_idx]
-    all_data_cols = df.columns[1:]
-    last_four_data_cols = all_data_cols[-4:]
-    last_four_week_headers = [str(header_row[col]) for col in last_four_data_cols]
-    data_start_row = start_row_idx + 1
-    data_end_row = data_start_row + num_rows
-    categories = df.iloc[data_start_row : data_end_row, 0].values.tolist()
-    data_dict = {h: df.loc[data_start_row : data_end_row - 1, col].tolist() for h, col in zip(last_four_week_headers, last_four_data_cols)}
+    last_four_data_positions = np.arange(1, df.shape[1])[-4:]
+    data_end_row = start_row_idx + 1 + num_rows
+    # The header row and the data rows below it, label column first, as one positional slice
+    block = df.iloc[start_row_idx : data_end_row, np.r_[0, last_four_data_positions]].to_numpy(dtype=object)
+    last_four_week_headers = block[0, 1:].astype(str).tolist()
+    categories = block[1:, 0].tolist()
+    data_dict = dict(zip(last_four_week_headers, block[1:, 1:].T.tolist()))
     return categories, data_dict, last_four_week_headers
 
 def _set_font_for_table_slide9(table):
     for row_idx, row in enumerate(table.rows):
         is_total_row = 'total' in str(row.cells[0].text).lower()
+        bold = row_idx == 0 or is_total_row
         for cell in row.cells:
             for para in cell.text_frame.paragraphs:
                 para.alignment = PP_ALIGN.CENTER
                 for run in para.runs:
-                    run.font.name = "Aptos"
-                    run.font.size = Pt(11)
-                    if row_idx == 0 or is_total_row:
-                        run.font.bold = True
-                    else:
-                        run.font.bold = False
+                    _set_run_xml(run, "Aptos", 11, bold)
 
 def _populate_table_slide9(table_shape, categories, data_dict, headers, top_left_cell_text: str):
     if not (table_shape and table_shape.has_table): return
     table = table_shape.table
-    table.cell(0, 0).text = top_left_cell_text
+    _write_cell_text(table.cell(0, 0)._tc, top_left_cell_text)
     for i, header in enumerate(headers):
-        table.cell(0, i + 1).text = str(header)
+        _write_cell_text(table.cell(0, i + 1)._tc, str(header))
     for row_idx, label in enumerate(categories):
-        table.cell(row_idx + 1, 0).text = label
+        _write_cell_text(table.cell(row_idx + 1, 0)._tc, label)
         for col_idx, header in enumerate(headers):
-            table.cell(row_idx + 1, col_idx + 1).text = str(data_dict[header][row_idx])
+            _write_cell_text(table.cell(row_idx + 1, col_idx + 1)._tc, str(data_dict[header][row_idx]))
     _set_font_for_table_slide9(table)
 
 def _add_line_chart_slide9(slide, categories, data_dict, position, title, num_gridlines: int):
     if data_dict is None: return
     chart_data = ChartData()
-    chart_data.categories = [c for c in categories if 'total' not in c.lower()]
+    # Total rows are left out of the chart
+    category_mask = np.array(['total' not in c.lower() for c in categories], dtype=bool)
+    chart_data.categories = [c for c, keep in zip(categories, category_mask) if keep]
     
-    all_values = []
-    for week, values in data_dict.items():
-        series_values = [val for cat, val in zip(categories, values) if 'total' not in cat.lower()]
-        all_values.extend(series_values)
-        chart_data.add_series(week, series_values)
+    # Weeks x categories array of the charted values
+    series_values = np.array(list(data_dict.values()), dtype=object).reshape(len(data_dict), len(categories))[:, category_mask]
+    chart_values = add_series_from_array(chart_data, data_dict, series_values)
 
     chart_shape = slide.shapes.add_chart(XL_CHART_TYPE.LINE_MARKERS, *position, chart_data)
     chart = chart_shape.chart
     
     value_axis = chart.value_axis
-    if num_gridlines and all_values:
-        max_val = max(all_values) if all_values else 0
+    if num_gridlines and chart_values.size:
+        max_val = chart_values.max().item()
         if max_val > 0:
             power = 10**math.floor(math.log10(max_val))
             max_y = math.ceil(max_val / power) * power
@@ -444,21 +517,7 @@ def _add_line_chart_slide9(slide, categories, data_dict, position, title, num_gr
         value_axis.major_unit = max_y / num_gridlines
         value_axis.has_major_gridlines = True
 
-    tick_labels = value_axis.tick_labels
-    tick_labels.number_format = '0'
-    tick_labels.font.size = Pt(9)
-
-    chart.has_title = True
-    chart.chart_title.text_frame.text = title
-    chart.chart_title.text_frame.paragraphs[0].font.size = Pt(22)
-    chart.has_legend = True
-    chart.legend.position = XL_LEGEND_POSITION.BOTTOM
-    chart.legend.include_in_layout = False
-    chart.legend.font.size = Pt(9)
-    plot = chart.plots[0]
-    plot.has_data_labels = True
-    plot.data_labels.font.size = Pt(9)
-    chart.category_axis.tick_labels.font.size = Pt(9)
+    _format_chart(chart, title)
 
 def _update_conclusion_slide9(slide, categories, data_dict, headers):
     if data_dict:
@@ -468,28 +527,28 @@ def _update_conclusion_slide9(slide, categories, data_dict, headers):
         
         last_week_header = headers[-1]
         last_week_total = data_dict[last_week_header][total_row_index]
-        last_week_num = re.search(r'\d+', last_week_header).group(0)
+        last_week_num = _WEEKNUM_RE.search(last_week_header).group(0)
 
         conclusion_shape = find_shape_by_name(slide, "Conclusion")
         if conclusion_shape and conclusion_shape.has_text_frame:
             p = conclusion_shape.text_frame.paragraphs[0]
             p.text = f"{last_week_total} successful changes for Week {last_week_num}"
-            print("   -> Updated 'Conclusion' text box.")
+            log.info("   -> Updated 'Conclusion' text box.")
 
 def populate_slide_9(prs, df, slide_index):
-    print(f"--- Populating Slide {slide_index + 1} ---")
+    log.info("--- Populating Slide %d ---", slide_index + 1)
     slide = prs.slides[slide_index]
     
-    print("   -> Extracting data for tables and charts...")
+    log.info("   -> Extracting data for tables and charts...")
     type_cats, type_data, type_headers = _extract_data_block_slide9(df, start_label="Type", num_rows=6)
     closure_cats, closure_data, closure_headers = _extract_data_block_slide9(df, start_label="Closure Type", num_rows=4)
 
-    print("   -> Formatting main title...")
+    log.info("   -> Formatting main title...")
     title_shape = find_shape_by_name(slide, 'Title')
     if title_shape and type_headers:
         format_main_title(title_shape, type_headers[-1])
 
-    print("   -> Populating tables...")
+    log.info("   -> Populating tables...")
     cr_table_shape = find_shape_by_name(slide, "CR Table")
     ccs_table_shape = find_shape_by_name(slide, "CCS Table")
     _populate_table_slide9(cr_table_shape, type_cats, type_data, type_headers, "Change")
@@ -498,14 +557,14 @@ def populate_slide_9(prs, df, slide_index):
     pos_cr = (Cm(0.78), Cm(1.64), Cm(15.31), Cm(7.63))
     pos_ccs = (Cm(16.54), Cm(1.64), Cm(16.55), Cm(7.6))
     
-    print("   -> Creating line charts...")
+    log.info("   -> Creating line charts...")
     _add_line_chart_slide9(slide, type_cats, type_data, pos_cr, "Changes Requests", num_gridlines=7)
     _add_line_chart_slide9(slide, closure_cats, closure_data, pos_ccs, "Change Closure Status", num_gridlines=7)
 
-    print("   -> Updating conclusion text box...")
+    log.info("   -> Updating conclusion text box...")
     _update_conclusion_slide9(slide, closure_cats, closure_data, closure_headers)
 
-    print(f"✅ Slide {slide_index + 1} populated.")
+    log.info("✅ Slide %d populated.", slide_index + 1)
 
 # =================================================================================
 # LOGIC FOR SLIDE 10
@@ -516,40 +575,38 @@ def _extract_data_for_slide10(df: pd.DataFrame):
     all_tables_data = []
     target_table_titles = ["Business Service - INC", "Business Service - RITM", "Business Service - Change Requests"]
 
+    # The titles and the last four (week) columns as arrays, built once for all tables
+    col0 = df[0].astype(str).str.strip().to_numpy()
+    tail = df.iloc[:, -4:].to_numpy(dtype=object)
+    tail_text = tail.astype(str)
+
     for table_title in target_table_titles:
         try:
-            df[0] = df[0].astype(str).str.strip()
-            title_rows = df[df[0] == table_title]
-            if title_rows.empty: continue
-            start_index = title_rows.index[0]
-
-            search_area = df.iloc[start_index:]
-            grand_total_rows = search_area[search_area[0] == 'Grand Total']
-            if grand_total_rows.empty: continue
-            end_index = grand_total_rows.index[0]
-
-            header_row_index = -1
-            for idx in range(start_index, end_index):
-                if any('Week' in str(cell) for cell in df.iloc[idx].iloc[-4:]):
-                    header_row_index = idx
-                    break
-            if header_row_index == -1: continue
-            
-            header_row = df.iloc[header_row_index]
-            week_labels = [str(label).strip() for label in header_row.iloc[-4:]]
+            title_rows = np.flatnonzero(col0 == table_title)
+            if not title_rows.size: continue
+            start_index = title_rows[0]
+
+            grand_total_rows = np.flatnonzero(col0[start_index:] == 'Grand Total')
+            if not grand_total_rows.size: continue
+            end_index = start_index + grand_total_rows[0]
+
+            # The header is the first row of the block with 'Week' in any of its last four cells
+            week_mask = (np.char.find(tail_text[start_index:end_index], 'Week') >= 0).any(axis=1)
+            if not week_mask.any(): continue
+            header_row_index = start_index + int(week_mask.argmax())
+
+            week_labels = np.char.strip(tail_text[header_row_index]).tolist()
             
             headers = [table_title] + week_labels
-            data_rows = []
-            for i in range(header_row_index + 1, end_index + 1):
-                current_row = df.iloc[i]
-                row_title = str(current_row.iloc[0]).strip()
-                if not row_title: continue
-                data = [int(val) for val in current_row.iloc[-4:]]
-                data_rows.append([row_title] + data)
+            rows = slice(header_row_index + 1, end_index + 1)
+            # Rows without a title are dropped with one mask before the block is converted
+            keep = col0[rows] != ''
+            values = tail[rows][keep].astype(np.float64).astype(np.int64).tolist()
+            data_rows = [[row_title] + data for row_title, data in zip(col0[rows][keep], values)]
             
             all_tables_data.append({"title": table_title, "headers": headers, "data": data_rows})
         except Exception as e:
-            print(f"  -> ERROR processing table '{table_title}': {e}")
+            log.error("Could not process table '%s': %s", table_title, e)
     return all_tables_data
 
 def _create_and_populate_table_slide10(slide, position: dict, table_data: dict):
@@ -567,14 +624,16 @@ def _create_and_populate_table_slide10(slide, position: dict, table_data: dict):
         table.columns[i].width = data_col_width
 
     for col_idx, header in enumerate(headers):
-        table.cell(0, col_idx).text = header
+        _write_cell_text(table.cell(0, col_idx)._tc, header)
 
     for row_idx, data_row in enumerate(data_rows, 1):
         for col_idx, cell_text in enumerate(data_row):
-            table.cell(row_idx, col_idx).text = str(cell_text)
+            _write_cell_text(table.cell(row_idx, col_idx)._tc, str(cell_text))
 
     for row_idx, row in enumerate(table.rows):
         is_total_row = 'total' in table.cell(row_idx, 0).text.lower()
+        # Bold is only switched on; other rows keep the template's weight
+        bold = True if row_idx == 0 or is_total_row else None
         for col_idx, cell in enumerate(row.cells):
             cell.vertical_anchor = MSO_ANCHOR.MIDDLE
             cell.margin_left = Cm(0.1)
@@ -585,19 +644,16 @@ def _create_and_populate_table_slide10(slide, position: dict, table_data: dict):
             for para in cell.text_frame.paragraphs:
                 para.alignment = PP_ALIGN.LEFT if col_idx == 0 else PP_ALIGN.CENTER
                 for run in para.runs:
-                    run.font.name = "Aptos"
-                    run.font.size = Pt(7)
-                    if row_idx == 0 or is_total_row:
-                        run.font.bold = True
+                    _set_run_xml(run, "Aptos", 7, bold)
 
 def populate_slide_10(prs, df, slide_index):
     """Main function to create and populate the three tables on Slide 10."""
-    print(f"--- Populating Slide {slide_index + 1} ---")
+    log.info("--- Populating Slide %d ---", slide_index + 1)
     slide = prs.slides[slide_index]
     
     all_tables_data = _extract_data_for_slide10(df)
     if not all_tables_data:
-        print(f"🛑 Could not extract data for Slide {slide_index + 1}. Skipping.")
+        log.error("Could not extract data for Slide %d. Skipping.", slide_index + 1)
         return
 
     table_positions = {
@@ -606,54 +662,72 @@ def populate_slide_10(prs, df, slide_index):
         "Business Service - Change Requests": {"left": Cm(0.78), "top": Cm(10.55), "width": Cm(16.07), "height": Cm(6.95)}
     }
     
-    for shape_name in ["BSI", "BSR", "BSC"]:
-        if shape := find_shape_by_name(slide, shape_name):
-            sp = shape._sp
+    # Find all three placeholder tables in a single XPath query over the shape tree,
+    # keeping the first shape for each name as find_shape_by_name would
+    placeholder_names = ["BSI", "BSR", "BSC"]
+    name_test = " or ".join(f'@name="{name}"' for name in placeholder_names)
+    placeholders = {}
+    for sp in slide.shapes._spTree.xpath(f"./*[*/p:cNvPr[{name_test}]]"):
+        placeholders.setdefault(sp.xpath("string(*/p:cNvPr/@name)"), sp)
+    for shape_name in placeholder_names:
+        if (sp := placeholders.get(shape_name)) is not None:
             sp.getparent().remove(sp)
-            print(f"  -> Deleted placeholder table '{shape_name}'.")
+            log.info("  -> Deleted placeholder table '%s'.", shape_name)
+        else:
+            log.warning(_SHAPE_NOT_FOUND_MSG, shape_name)
+    _invalidate_shape_index(slide)
 
     for table_data in all_tables_data:
         if position := table_positions.get(table_data["title"]):
-            print(f"  -> Creating table for '{table_data['title']}'...")
+            log.info("  -> Creating table for '%s'...", table_data['title'])
             _create_and_populate_table_slide10(slide, position, table_data)
         else:
-            print(f"  -> WARNING: No position mapping for '{table_data['title']}'.")
+            log.warning("No position mapping for '%s'.", table_data['title'])
 
-    print(f"✅ Slide {slide_index + 1} populated.")
+    log.info("✅ Slide %d populated.", slide_index + 1)
 
 # =================================================================================
 # REUSABLE STYLING FUNCTION
 # =================================================================================
 
-def apply_chart_styles(input_path, output_path, styles_to_apply: Dict[int, int]):
-    print(f"\n--- Applying Final Chart Styles ---")
+def apply_chart_styles(path, styles_to_apply: Dict[int, int]):
+    """Opens a saved presentation in PowerPoint, sets ChartStyle on the charts of the given slides and saves it in place."""
+    log.info("\n--- Applying Final Chart Styles ---")
     powerpoint = None
     presentation = None
     try:
         powerpoint = win32com.client.Dispatch("PowerPoint.Application")
-        presentation = powerpoint.Presentations.Open(os.path.abspath(input_path))
+        presentation = powerpoint.Presentations.Open(os.path.abspath(path))
         powerpoint.WindowState = 2
-        time.sleep(2)
+        # Every property access is a COM round-trip, so look each collection up once
+        slides = presentation.Slides
+        slide_count = slides.Count
         for slide_index, style_id in styles_to_apply.items():
-            if presentation.Slides.Count < (slide_index + 1):
-                print(f"   -> Skipping style for slide {slide_index + 1}, slide does not exist.")
+            if slide_count < (slide_index + 1):
+                log.info("   -> Skipping style for slide %d, slide does not exist.", slide_index + 1)
                 continue
-            target_slide = presentation.Slides(slide_index + 1)
-            print(f"   -> Targeting Slide {slide_index + 1} for Style ID {style_id}...")
-            for shape in target_slide.Shapes:
-                if shape.HasChart:
-                    shape.Chart.ChartStyle = style_id
-        presentation.SaveAs(os.path.abspath(output_path))
+            shapes = slides(slide_index + 1).Shapes
+            log.info("   -> Targeting Slide %d for Style ID %d...", slide_index + 1, style_id)
+            for i in range(1, shapes.Count + 1):
+                shape = shapes.Item(i)
+                if not shape.HasChart:
+                    continue
+                shape.Chart.ChartStyle = style_id
+        presentation.Save()
     finally:
         if presentation: presentation.Close()
         if powerpoint: powerpoint.Quit()
-    print("✅ Styling complete.")
+    log.info("✅ Styling complete.")
 
 # =================================================================================
 # MAIN EXECUTION WORKFLOW
 # =================================================================================
 
 if __name__ == "__main__":
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(_ProgressFormatter("%(message)s"))
+    logging.basicConfig(level=os.environ.get("LOGLEVEL", "INFO").upper(), handlers=[handler])
+
     EXCEL_FILE_PATH = 'Files/ExcelData27.xlsx'
     TEMPLATE_PPTX_PATH = 'Files/Default_Template.pptx'
     FINAL_OUTPUT_PPTX_PATH = 'Output/Final_Output.pptx'
@@ -673,19 +747,28 @@ if __name__ == "__main__":
     CHART_STYLE_FOR_LINE_CHARTS = 228
 
     os.makedirs(os.path.dirname(FINAL_OUTPUT_PPTX_PATH), exist_ok=True)
-    temp_output_path = os.path.join(os.path.dirname(FINAL_OUTPUT_PPTX_PATH), "temp_presentation.pptx")
 
-    try:
-        df_slide6 = pd.read_excel(EXCEL_FILE_PATH, sheet_name=SHEET_NAME_SLIDE_6)
-        df_slide7 = pd.read_excel(EXCEL_FILE_PATH, sheet_name=SHEET_NAME_SLIDE_7)
-        df_slide8 = pd.read_excel(EXCEL_FILE_PATH, sheet_name=SHEET_NAME_SLIDE_8)
-        df_slide9 = pd.read_excel(EXCEL_FILE_PATH, sheet_name=SHEET_NAME_SLIDE_9)
-        df_slide10 = pd.read_excel(EXCEL_FILE_PATH, sheet_name=SHEET_NAME_SLIDE_10, header=None).fillna(0)
-    except Exception as e:
-        print(f"🛑 FATAL ERROR reading Excel file: {e}")
-        exit()
-
-    prs = Presentation(TEMPLATE_PPTX_PATH)
+    if not HAS_CALAMINE:
+        # Sheets are still read, just through the much slower pure-Python openpyxl/pyxlsb engines
+        log.warning("python-calamine is not installed, so Excel sheets are read with the slower default engines. "
+                    "Install it with: pip install python-calamine")
+
+    # The template does not depend on the workbook, so it is unzipped and parsed on a
+    # worker thread while the sheets are read
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        template_future = executor.submit(Presentation, TEMPLATE_PPTX_PATH)
+        try:
+            # The workbook is opened once; slides 6-9 share one read and slide 10 (no header row) takes a second
+            sheets = read_sheets(EXCEL_FILE_PATH, (SHEET_NAME_SLIDE_6, SHEET_NAME_SLIDE_7, SHEET_NAME_SLIDE_8, SHEET_NAME_SLIDE_9))
+            df_slide6 = sheets[SHEET_NAME_SLIDE_6]
+            df_slide7 = sheets[SHEET_NAME_SLIDE_7]
+            df_slide8 = sheets[SHEET_NAME_SLIDE_8]
+            df_slide9 = sheets[SHEET_NAME_SLIDE_9]
+            df_slide10 = read_sheets(EXCEL_FILE_PATH, (SHEET_NAME_SLIDE_10,), header=None)[SHEET_NAME_SLIDE_10].fillna(0)
+        except Exception as e:
+            log.error("Could not read the Excel file: %s", e)
+            exit()
+        prs = template_future.result()
     
     populate_slide_6(prs, df_slide6, SLIDE_6_INDEX)
     populate_slide_7(prs, df_slide7, SLIDE_7_INDEX)
@@ -693,25 +776,19 @@ if __name__ == "__main__":
     populate_slide_9(prs, df_slide9, SLIDE_9_INDEX)
     populate_slide_10(prs, df_slide10, SLIDE_10_INDEX)
     
-    print("\n💾 Saving presentation with all content...")
-    prs.save(temp_output_path)
-    
-    styles_to_apply = {
-        SLIDE_6_INDEX: CHART_STYLE_FOR_LINE_CHARTS,
-        SLIDE_8_INDEX: CHART_STYLE_FOR_LINE_CHARTS,
-        SLIDE_9_INDEX: CHART_STYLE_FOR_LINE_CHARTS
-    }
-
-    apply_chart_styles(
-        input_path=temp_output_path,
-        output_path=FINAL_OUTPUT_PPTX_PATH,
-        styles_to_apply=styles_to_apply
-    )
-    
-    try:
-        os.remove(temp_output_path)
-        print(f"🧹 Temporary file has been deleted.")
-    except OSError as e:
-        print(f"Warning: Could not delete temporary file: {e}")
+    # The presentation is saved straight to its final path; PowerPoint then restyles that file in place
+    log.info("\n💾 Saving presentation with all content...")
+    prs.save(FINAL_OUTPUT_PPTX_PATH)
+
+    if HAS_WIN32COM:
+        apply_chart_styles(FINAL_OUTPUT_PPTX_PATH, {
+            SLIDE_6_INDEX: CHART_STYLE_FOR_LINE_CHARTS,
+            SLIDE_8_INDEX: CHART_STYLE_FOR_LINE_CHARTS,
+            SLIDE_9_INDEX: CHART_STYLE_FOR_LINE_CHARTS
+        })
+    else:
+        log.warning("pywin32 is not installed, so the line charts on slides %d, %d and %d keep the default chart style. "
+                    "Run on Windows with PowerPoint and pip install pywin32 to apply style %d.",
+                    SLIDE_6_INDEX + 1, SLIDE_8_INDEX + 1, SLIDE_9_INDEX + 1, CHART_STYLE_FOR_LINE_CHARTS)
 
-    print(f"\n🎉🎉🎉 Workflow Finished! Your final presentation is ready at:\n{FINAL_OUTPUT_PPTX_PATH}")
+    log.info("\n🎉🎉🎉 Workflow Finished! Your final presentation is ready at:\n%s", FINAL_OUTPUT_PPTX_PATH)
@@ -0,0 +1,122 @@
+import weakref
+from bisect import bisect_left
+from typing import Callable, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# =================================================================================
+# SHARED HELPERS FOR TABLE BLOCKS
+# =================================================================================
+
+# Below this many rows the dict index is cheaper than Numba's JIT warm-up
+NUMBA_MIN_ROWS = 50_000
+
+if njit is not None:
+    @njit(cache=True)
+    def _first_hash_match(hashes, target, start):
+        for i in range(start, hashes.shape[0]):
+            if hashes[i] == target:
+                return i
+        return -1
+else:
+    _first_hash_match = None
+
+def last_n_week_cols(header_row: pd.Series, n: int = 4) -> List:
+    """Returns the column labels of the last n header cells that contain 'Week'."""
+    week_mask = header_row.astype(str).str.contains("Week", na=False, regex=False)
+    return header_row.index[week_mask.to_numpy()][-n:].tolist()
+
+# Per-sheet work that every block on the same DataFrame shares. Keyed by id(df)
+# and dropped when the DataFrame is garbage collected.
+_col0_lower_cache = {}
+_week_cols_cache = {}
+
+def cached_per_frame(cache: dict, df: pd.DataFrame, build):
+    """Returns build(df), computing it only the first time it is asked for on this DataFrame."""
+    key = id(df)
+    if key not in cache:
+        cache[key] = build(df)
+        weakref.finalize(df, cache.pop, key, None)
+    return cache[key]
+
+def find_data_row(df: pd.DataFrame, label_text: str) -> int:
+    """Finds the row index for a specific data label in the first column."""
+    col0 = cached_per_frame(_col0_lower_cache, df, lambda d: d.iloc[:, 0].astype(str).str.lower())
+    mask = col0.str.contains(label_text.lower(), na=False, regex=False)
+    return mask.idxmax() if mask.any() else -1
+
+def extract_block(df: pd.DataFrame, start_label: Union[str, int], num_rows: int, header_offset: int = 0,
+                  week_columns: bool = True) -> Tuple[List, np.ndarray, np.ndarray]:
+    """
+    Extracts the num_rows rows that follow a block's header row, restricted to the last
+    four columns whose header contains 'Week' (or, with week_columns=False, simply the
+    last four data columns).
+
+    start_label is the first-column text of the row to anchor on, or that row's index;
+    the header row sits header_offset rows from it. Returns (headers, categories, data)
+    where data is a (rows, 4) object array, or (None, None, None) if the label is missing.
+    """
+    start_row_idx = start_label if isinstance(start_label, int) else find_data_row(df, start_label)
+    if start_row_idx == -1:
+        return None, None, None
+    header_row_idx = start_row_idx + header_offset
+
+    if week_columns:
+        frame_week_cols = cached_per_frame(_week_cols_cache, df, lambda d: {})
+        if header_row_idx not in frame_week_cols:
+            frame_week_cols[header_row_idx] = last_n_week_cols(df.iloc[header_row_idx])
+        col_positions = df.columns.get_indexer(frame_week_cols[header_row_idx])
+    else:
+        col_positions = np.arange(1, df.shape[1])[-4:]
+
+    headers = df.iloc[header_row_idx, col_positions].tolist()
+    data_rows = slice(header_row_idx + 1, header_row_idx + 1 + num_rows)
+    categories = df.iloc[data_rows, 0].to_numpy(dtype=object)
+    # Object dtype keeps each column's values as they were read (no int -> float upcast)
+    data = df.iloc[data_rows, col_positions].to_numpy(dtype=object)
+    return headers, categories, data
+
+def stack_columns(columns: List, num_rows: int) -> np.ndarray:
+    """
+    Stacks equal-length value lists side by side into a (num_rows, len(columns)) object
+    array, keeping each value's type. With no columns the array is (num_rows, 0), so
+    callers still get one (empty) row per category.
+    """
+    if not columns:
+        return np.empty((num_rows, 0), dtype=object)
+    return np.column_stack([np.asarray(column, dtype=object) for column in columns])
+
+def label_finder(labels: np.ndarray) -> Callable[..., int]:
+    """
+    Returns find(label, start=0), which gives the first row at or after start whose
+    label equals label exactly, or -1. Long columns are hashed once and scanned with
+    Numba when it is installed; otherwise each label's rows are indexed in a dict.
+    """
+    if _first_hash_match is not None and len(labels) > NUMBA_MIN_ROWS:
+        labels = np.asarray(labels, dtype=object)
+        hashes = pd.util.hash_array(labels)
+
+        def find(label, start=0):
+            target = pd.util.hash_array(np.array([label], dtype=object))[0]
+            i = _first_hash_match(hashes, target, start)
+            # Step past the (astronomically unlikely) hash collisions
+            while i != -1 and labels[i] != label:
+                i = _first_hash_match(hashes, target, i + 1)
+            return int(i)
+        return find
+
+    positions = {}
+    for i, label in enumerate(labels):
+        positions.setdefault(label, []).append(i)
+
+    def find(label, start=0):
+        rows = positions.get(label, [])
+        k = bisect_left(rows, start)
+        return rows[k] if k < len(rows) else -1
+    return find
@@ -0,0 +1,75 @@
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from workbook_cache import HAS_CALAMINE, get_workbook
+
+# =================================================================================
+# SHARED EXCEL READING
+# =================================================================================
+
+def read_sheet(path: str, sheet: str, **kwargs) -> pd.DataFrame:
+    """Reads a single sheet from the cached workbook, using calamine when it is installed."""
+    return get_workbook(path).parse(sheet, **kwargs)
+
+@lru_cache(maxsize=None)
+def read_sheets(path: str, sheets: Tuple[str, ...], header=0) -> Dict[str, pd.DataFrame]:
+    """
+    Reads several sheets in one parse call and returns them as {sheet name: DataFrame}.
+    Results are cached per (path, sheets, header), so the returned frames are shared.
+    """
+    return get_workbook(path).parse(list(sheets), header=header)
+
+def sheet_width(path: str, sheet: str) -> Optional[int]:
+    """
+    Returns the number of columns (counted from column A) holding values in a sheet, without
+    loading it into pandas. Returns None when the engine cannot tell: openpyxl and pyxlsb report
+    the sheet dimension, which also counts formatted cells that pandas drops as empty.
+    """
+    workbook = get_workbook(path)
+    if workbook.engine != "calamine":
+        return None
+    end = workbook.book.get_sheet_by_name(sheet).end
+    return end[1] + 1 if end else 0
+
+def last_columns(path: str, sheet: str, n: int = 4) -> Optional[List[int]]:
+    """
+    Returns the positions of the first column and the last n columns, for use as usecols.
+    Returns None (read every column) when the sheet width is not known exactly.
+    """
+    width = sheet_width(path, sheet)
+    if width is None:
+        return None
+    return [0] + list(range(max(1, width - n), width))
+
+def edge_columns(df: pd.DataFrame, n: int = 4) -> Tuple[np.ndarray, np.ndarray]:
+    """Splits a header=None sheet into its first column and an (rows, n) array of its last n columns."""
+    return df.iloc[:, 0].to_numpy(dtype=object), df.iloc[:, -n:].to_numpy(dtype=object)
+
+def read_edge_columns(path: str, sheet: str, n: int = 4) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reads only a sheet's first column and last n columns, one entry per sheet row.
+    Without calamine, .xlsb sheets are streamed row by row through pyxlsb rather
+    than being loaded into a DataFrame.
+    """
+    if not HAS_CALAMINE and path.lower().endswith(".xlsb"):
+        return _stream_xlsb_edge_columns(path, sheet, n)
+    return edge_columns(read_sheet(path, sheet, header=None, usecols=last_columns(path, sheet, n)), n)
+
+def _xlsb_value(value):
+    # pyxlsb returns every number as a float; match pandas, which reads whole numbers as int
+    return int(value) if isinstance(value, float) and value.is_integer() else value
+
+def _stream_xlsb_edge_columns(path: str, sheet: str, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    col0, tail = [], []
+    with get_workbook(path).book.get_sheet(sheet) as ws:
+        # sparse=True skips empty rows, so pad them back in to keep row positions
+        for row in ws.rows(sparse=True):
+            while len(col0) < row[0].r:
+                col0.append(None)
+                tail.append([None] * n)
+            col0.append(_xlsb_value(row[0].v))
+            tail.append([_xlsb_value(cell.v) for cell in row[-n:]])
+    return np.array(col0, dtype=object), np.array(tail, dtype=object).reshape(-1, n)
@@ -0,0 +1,29 @@
+from functools import lru_cache
+
+import pandas as pd
+
+# =================================================================================
+# SHARED WORKBOOK CACHE
+# =================================================================================
+
+try:
+    # Rust-backed reader; parses .xlsx and .xlsb an order of magnitude faster
+    # than the pure-Python openpyxl/pyxlsb engines.
+    import python_calamine  # noqa: F401
+    HAS_CALAMINE = True
+except ImportError:
+    HAS_CALAMINE = False
+
+def excel_engine(path: str) -> str:
+    """Returns the pandas engine to use for the given workbook path."""
+    if HAS_CALAMINE:
+        return "calamine"
+    return "pyxlsb" if path.lower().endswith(".xlsb") else "openpyxl"
+
+@lru_cache(maxsize=None)
+def get_workbook(path: str) -> pd.ExcelFile:
+    """
+    Opens a workbook once and returns the same handle on every later call, so
+    each slide's sheet is pulled from a single open instead of re-reading the file.
+    """
+    return pd.ExcelFile(path, engine=excel_engine(path))